@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSON encoders for Minecraft recipe output.
+Compares the default indented output with canonical compact JSON from each
+available backend, and checks that all canonical backends emit identical bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from minecraft_recipe import RecipeTemplate, get_canonical_encoder, pretty_json
+
+
+def build_recipes(variants: int) -> list[dict]:
+    """Expand a template into the requested number of distinct recipes."""
+    values = ', '.join(f"v{i}" for i in range(variants))
+    template = RecipeTemplate(
+        f"@variant = {values}\n"
+        "myname:{variant}_lamp\n"
+        "A-A\n"
+        "ABA\n"
+        "ACA\n"
+        "A = minecraft:{variant}_wool\n"
+        "B = myname:{variant}_bulb\n"
+        "C = minecraft:coal\n"
+        "1\n"
+    )
+    template.parse()
+    return [recipe_json for _, recipe_json in template.expand('bench')]
+
+
+def time_encoder(encode: Callable[[dict], bytes], recipes: list[dict], repeat: int) -> float:
+    """Return the best time in seconds to encode all recipes once."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for recipe_json in recipes:
+            encode(recipe_json)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(
+        description='Benchmark JSON encoders for recipe output.'
+    )
+    parser.add_argument(
+        '--recipes',
+        type=int,
+        default=10000,
+        help='Number of recipes to encode (default: 10000)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Number of timing runs; the best is reported (default: 5)'
+    )
+
+    args = parser.parse_args()
+
+    recipes = build_recipes(args.recipes)
+
+    encoders = [('indent=2 (default)', pretty_json)]
+    canonical = {}
+    for backend in ('json', 'orjson'):
+        try:
+            canonical[backend] = get_canonical_encoder(backend)
+        except ValueError as e:
+            print(f"Skipping {backend}: {e}")
+            continue
+        encoders.append((f"compact ({backend})", canonical[backend]))
+
+    # Canonical output must not depend on the backend
+    outputs = {
+        backend: [encode(recipe_json) for recipe_json in recipes]
+        for backend, encode in canonical.items()
+    }
+    if len({tuple(output) for output in outputs.values()}) > 1:
+        print("Error: canonical backends produced different bytes", file=sys.stderr)
+        sys.exit(1)
+
+    baseline = None
+    print(f"{'Encoder':<22} {'Time':>10} {'Bytes':>12} {'Speedup':>8}")
+    for label, encode in encoders:
+        elapsed = time_encoder(encode, recipes, args.repeat)
+        size = sum(len(encode(recipe_json)) for recipe_json in recipes)
+        if baseline is None:
+            baseline = elapsed
+        print(f"{label:<22} {elapsed:>9.3f}s {size:>12} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
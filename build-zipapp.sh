@@ -0,0 +1,39 @@
+#!/usr/bin/env bash
+# Build single-file zipapp entry points for the Python scripts
+
+set -e
+
+OUT_DIR="${1:-dist}"
+STAGE_DIR="$(mktemp -d)"
+trap 'rm -rf "$STAGE_DIR"' EXIT
+
+# Resolve the output directory before moving to the script directory
+mkdir -p "$OUT_DIR"
+OUT_DIR="$(cd "$OUT_DIR" && pwd)"
+cd "$(dirname "$0")"
+
+# Ship legacy-layout .pyc files (-b) next to the sources: zipimport loads them
+# directly, so the archives skip bytecode compilation on every start.
+build() {
+    local name="$1"
+    shift
+    rm -rf "$STAGE_DIR/$name"
+    mkdir -p "$STAGE_DIR/$name"
+    cp "$@" "$STAGE_DIR/$name/"
+    python3 -m compileall -q -b "$STAGE_DIR/$name"
+    python3 -m zipapp "$STAGE_DIR/$name" \
+        -p "/usr/bin/env python3" \
+        -m "$name:main" \
+        -o "$OUT_DIR/$name.pyz"
+}
+
+echo "Building zipapps in $OUT_DIR..."
+build minecraft_recipe minecraft_recipe.py
+build minecraft_recipe_ui minecraft_recipe_ui.py
+
+echo ""
+echo "Build complete!"
+echo "Converter: $OUT_DIR/minecraft_recipe.pyz"
+echo "Terminal UI: $OUT_DIR/minecraft_recipe_ui.pyz"
+echo ""
+ls -lh "$OUT_DIR"/*.pyz
@@ -4,22 +4,36 @@ Minecraft Bedrock Recipe Generator
 Converts text recipe definitions to JSON format for Minecraft Bedrock edition.
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import re
-import shutil
 import sys
-import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from itertools import product
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from zipfile import ZipFile, ZIP_STORED
+
+# Set to False rather than imported from typing, which would slow startup;
+# type checkers still treat the name as true
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from zipfile import ZipFile
+
+# Template placeholders, e.g. {color}
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+# shutil and zipfile are only needed when building a .mcaddon, so they are
+# imported inside the function that uses them to keep startup fast for plain
+# .txt to .json conversion.
 
 
 class RecipeParser:
     """Parse and validate Minecraft recipe text files."""
 
-    def __init__(self, content: str):
+    def __init__(self, content: str, line_offset: int = 0):
         self.lines = [line.rstrip() for line in content.strip().split('\n')]
+        self.line_offset = line_offset  # Lines before the recipe, for error messages
         self.result_identifier = None
         self.pattern = []
         self.substitutions = {}
@@ -37,7 +51,7 @@ class RecipeParser:
 
         # Lines 2-4: pattern
         self.pattern = self.lines[1:4]
-        for i, line in enumerate(self.pattern, start=2):
+        for i, line in enumerate(self.pattern, start=2 + self.line_offset):
             if len(line) != 3:
                 raise ValueError(f"Line {i} pattern must be exactly 3 characters (found {len(line)})")
 
@@ -65,7 +79,7 @@ class RecipeParser:
             raise
 
         # Parse substitutions
-        for i, line in enumerate(substitution_lines[:-1], start=5):
+        for i, line in enumerate(substitution_lines[:-1], start=5 + self.line_offset):
             line = line.strip()
             if not line:
                 continue
@@ -116,7 +130,7 @@ class RecipeParser:
         # Build key dictionary
         key = {
             symbol: {"item": item}
-            for symbol, item in self.substitutions.items():
+            for symbol, item in self.substitutions.items()
         }
 
         return {
@@ -138,6 +152,178 @@ class RecipeParser:
         }
 
 
+class RecipeTemplate:
+    """Parse recipe templates and expand them into concrete recipes.
+
+    A template is a recipe file in the RecipeParser format, preceded by
+    variable lines of the form ``@name = value1, value2, ...``. Every
+    ``{name}`` placeholder in the recipe lines is replaced by each value in
+    turn, and one recipe is produced per combination of variable values.
+    """
+
+    def __init__(self, content: str):
+        self.lines = [line.rstrip() for line in content.strip().split('\n')]
+        self.variables: dict[str, list[str]] = {}
+        self.body = ""
+        self.body_offset = 0
+
+    def parse(self) -> None:
+        """Parse the variable declarations and check the placeholders."""
+        body_start = 0
+        for i, line in enumerate(self.lines, start=1):
+            if not line.startswith('@'):
+                break
+            body_start = i
+
+            parts = line[1:].split('=', 1)
+            if len(parts) != 2:
+                raise ValueError(f"Line {i}: Invalid variable format (expected '@name = value1, value2')")
+
+            name = parts[0].strip()
+            values = [value.strip() for value in parts[1].split(',')]
+
+            if not re.fullmatch(r"\w+", name):
+                raise ValueError(f"Line {i}: Invalid variable name '{name}'")
+
+            if name in self.variables:
+                raise ValueError(f"Line {i}: Duplicate variable '{name}'")
+
+            # Values may not contain '-', which separates them in variant names
+            for value in values:
+                if not re.fullmatch(r"[\w.]+", value):
+                    raise ValueError(f"Line {i}: Invalid value '{value}' for variable '{name}'")
+
+            if len(set(values)) != len(values):
+                raise ValueError(f"Line {i}: Duplicate value for variable '{name}'")
+
+            self.variables[name] = values
+
+        # RecipeParser strips leading blank lines, so count them in the offset
+        body_lines = self.lines[body_start:]
+        while body_lines and not body_lines[0].strip():
+            body_lines.pop(0)
+            body_start += 1
+        self.body = '\n'.join(body_lines)
+        self.body_offset = body_start
+
+        used = set(PLACEHOLDER_PATTERN.findall(self.body))
+        undefined = used - set(self.variables)
+        if undefined:
+            raise ValueError(f"Undefined template variables: {', '.join(sorted(undefined))}")
+
+        unused = set(self.variables) - used
+        if unused:
+            raise ValueError(f"Template variables never used: {', '.join(sorted(unused))}")
+
+        # Variants share a behavior pack, so each needs its own result identifier
+        if self.variables:
+            in_identifier = set(PLACEHOLDER_PATTERN.findall(body_lines[0]))
+            missing = set(self.variables) - in_identifier
+            if missing:
+                raise ValueError(
+                    f"Line {self.body_offset + 1}: Template variables missing from the result identifier: "
+                    f"{', '.join(sorted(missing))}"
+                )
+
+        # Check the recipe structure once, before any variant is emitted
+        self._parse_variant('', tuple(values[0] for values in self.variables.values()))
+
+    @property
+    def variant_count(self) -> int:
+        """Number of recipes the template expands to."""
+        count = 1
+        for values in self.variables.values():
+            count *= len(values)
+        return count
+
+    def expand(self, base_name: str) -> Iterator[tuple[str, dict]]:
+        """
+        Lazily yield (name, recipe_json) for every variant of the template.
+
+        Variants are generated one at a time, so memory use does not grow
+        with the number of combinations. Each name is base_name followed by
+        the variable values, joined by hyphens; a template without
+        variables yields the single recipe named base_name.
+        """
+        for values in product(*self.variables.values()):
+            name = '-'.join((base_name,) + values)
+            yield name, self._parse_variant(name, values).to_json()
+
+    def _parse_variant(self, name: str, values: tuple) -> RecipeParser:
+        """Substitute one combination of values into the body and parse it."""
+        mapping = dict(zip(self.variables, values))
+        content = PLACEHOLDER_PATTERN.sub(lambda match: mapping[match.group(1)], self.body)
+
+        recipe_parser = RecipeParser(content, self.body_offset)
+        try:
+            recipe_parser.parse()
+        except ValueError as e:
+            if not self.variables or not name:
+                raise
+            raise ValueError(f"Variant {name}: {e}")
+
+        return recipe_parser
+
+
+def pretty_json(recipe_json: dict) -> bytes:
+    """Encode a recipe as indented JSON, the default output format."""
+    return json.dumps(recipe_json, indent=2).encode('utf-8')
+
+
+def get_canonical_encoder(backend: str = 'auto') -> Callable[[dict], bytes]:
+    """
+    Return a function that encodes a recipe as canonical compact JSON.
+
+    Canonical output has sorted keys, no whitespace, and non-ASCII text as
+    raw UTF-8, so the bytes are identical whichever backend produced them.
+
+    Args:
+        backend: 'orjson' for the orjson package, 'json' for the standard
+            library, or 'auto' to use orjson when it is installed
+
+    Returns:
+        Function mapping a recipe dict to UTF-8 encoded JSON bytes
+    """
+    if backend not in ('auto', 'orjson', 'json'):
+        raise ValueError(f"Unknown JSON backend: {backend}")
+
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+    def encode_json(recipe_json: dict) -> bytes:
+        return encoder.encode(recipe_json).encode('utf-8')
+
+    if backend != 'json':
+        try:
+            import orjson
+        except ImportError:
+            if backend == 'orjson':
+                raise ValueError("JSON backend 'orjson' is not installed")
+        else:
+            def encode_orjson(recipe_json: dict) -> bytes:
+                try:
+                    return orjson.dumps(recipe_json, option=orjson.OPT_SORT_KEYS)
+                except orjson.JSONEncodeError:
+                    # orjson rejects values it cannot represent, such as
+                    # integers beyond 64 bits; the stdlib handles them
+                    return encode_json(recipe_json)
+
+            return encode_orjson
+
+    return encode_json
+
+
+def write_json_files(
+    recipes: Iterable[tuple[str, dict]],
+    output_dir: Path,
+    encode: Callable[[dict], bytes] = pretty_json
+) -> Iterator[tuple[str, dict]]:
+    """Write each recipe to <output_dir>/<name>.json and pass it through."""
+    for name, recipe_json in recipes:
+        output_file = output_dir / f"{name}.json"
+        output_file.write_bytes(encode(recipe_json))
+        yield name, recipe_json
+
+
 def find_next_serial_number(base_path: Path, base_name: str) -> int:
     """Find the next available serial number for mcaddon files."""
     pattern = re.compile(rf"^{re.escape(base_name)}_(\d{{3}})\.mcaddon$")
@@ -151,6 +337,55 @@ def find_next_serial_number(base_path: Path, base_name: str) -> int:
     return max_serial + 1
 
 
+def find_behavior_pack(zip_in: ZipFile) -> str:
+    """
+    Return the top-level directory of the behavior pack in an open .mcaddon.
+
+    The behavior pack is the directory whose manifest.json declares a module
+    of type "data". Returns an empty string if there is none.
+    """
+    manifests = sorted(
+        name for name in zip_in.namelist()
+        if name.count('/') == 1 and name.endswith('/manifest.json')
+    )
+    for manifest in manifests:
+        try:
+            manifest_data = json.loads(zip_in.read(manifest))
+            for module in manifest_data.get('modules', []):
+                if module.get('type') == 'data':
+                    return manifest.split('/', 1)[0]
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    return ""
+
+
+def open_base_mcaddon(base_mcaddon: Path) -> tuple[ZipFile, str]:
+    """
+    Open a base .mcaddon for reading and locate its behavior pack.
+
+    Returns:
+        (ZipFile, behavior pack directory); the caller closes the ZipFile
+
+    Raises:
+        ValueError: If the file is not a zip archive or has no behavior pack
+    """
+    from zipfile import BadZipFile, ZipFile
+
+    try:
+        zip_in = ZipFile(base_mcaddon, 'r')
+    except BadZipFile:
+        raise ValueError(f"Not a valid .mcaddon file: {base_mcaddon}")
+
+    # Find the behavior pack directory (contains manifest.json and recipes/)
+    behavior_pack = find_behavior_pack(zip_in)
+    if not behavior_pack:
+        zip_in.close()
+        raise ValueError(f"Could not find behavior pack in {base_mcaddon}")
+
+    return zip_in, behavior_pack
+
+
 def create_mcaddon_with_recipe(
     input_file: Path,
     recipe_json: dict,
@@ -167,96 +402,131 @@ def create_mcaddon_with_recipe(
     Returns:
         Path to the created .mcaddon file
     """
-    # Determine base name and find next serial number
+    return create_mcaddon_with_recipes(input_file, [(input_file.stem, recipe_json)], base_mcaddon)
+
+
+def create_mcaddon_with_recipes(
+    input_file: Path,
+    recipes: Iterable[tuple[str, dict]],
+    base_mcaddon: Path,
+    encode: Callable[[dict], bytes] = pretty_json
+) -> Path:
+    """
+    Create a new .mcaddon file based on an existing one, adding many recipes.
+
+    Recipes are streamed straight into the new archive as they are produced,
+    so a lazy iterable of any length can be injected without extracting the
+    base .mcaddon or writing intermediate files.
+
+    Args:
+        input_file: The input text file (used to pick the output directory)
+        recipes: (name, recipe_json) pairs; each is stored as recipes/<name>.json
+        base_mcaddon: The base .mcaddon file to clone
+        encode: Function encoding a recipe as JSON bytes
+
+    Returns:
+        Path to the created .mcaddon file
+    """
+    import shutil
+    from zipfile import ZipFile, ZipInfo, ZIP_STORED
+
+    # Determine base name; the serial number is picked when the file is written
     base_name = base_mcaddon.stem
     if base_name.endswith('.mcaddon'):
         base_name = base_name[:-8]  # Remove .mcaddon if it's part of stem
 
     output_dir = input_file.parent
-    next_serial = find_next_serial_number(output_dir, base_name)
-    output_mcaddon = output_dir / f"{base_name}_{next_serial:03d}.mcaddon"
-
-    # Recipe filename based on input file stem
-    recipe_filename = f"{input_file.stem}.json"
-
-    # Create new mcaddon by copying base and adding recipe
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # Extract base mcaddon
-        with ZipFile(base_mcaddon, 'r') as zip_in:
-            zip_in.extractall(temp_path)
-
-        # Find the behavior pack directory (contains manifest.json and recipes/)
-        behavior_pack = None
-        for item in temp_path.iterdir():
-            if item.is_dir():
-                manifest = item / 'manifest.json'
-                if manifest.exists():
-                    # Check if this is the behavior pack (has recipes/ or should have it)
-                    # Behavior packs typically have "type": "data" in modules
-                    try:
-                        with manifest.open() as f:
-                            manifest_data = json.load(f)
-                            for module in manifest_data.get('modules', []):
-                                if module.get('type') == 'data':
-                                    behavior_pack = item
-                                    break
-                    except (json.JSONDecodeError, KeyError):
-                        pass
-
-                    if behavior_pack:
-                        break
-
-        if not behavior_pack:
-            raise ValueError(f"Could not find behavior pack in {base_mcaddon}")
-
-        # Ensure recipes directory exists
-        recipes_dir = behavior_pack / 'recipes'
-        recipes_dir.mkdir(exist_ok=True)
-
-        # Write recipe JSON
-        recipe_file = recipes_dir / recipe_filename
-        with recipe_file.open('w') as f:
-            json.dump(recipe_json, f, indent=2)
-
-        # Create new mcaddon (zip file)
-        with ZipFile(output_mcaddon, 'w', ZIP_STORED) as zip_out:
-            for file in temp_path.rglob('*'):
-                if file.is_file():
-                    arcname = file.relative_to(temp_path)
-                    zip_out.write(file, arcname)
+
+    zip_in, behavior_pack = open_base_mcaddon(base_mcaddon)
+    with zip_in:
+        recipes_prefix = f"{behavior_pack}/recipes/"
+        base_recipes = {name for name in zip_in.namelist() if name.startswith(recipes_prefix)}
+        replaced = set()
+
+        # Claim the next serial number with an exclusive create, so that
+        # concurrent runs in the same directory never overwrite each other
+        next_serial = find_next_serial_number(output_dir, base_name)
+        while True:
+            output_mcaddon = output_dir / f"{base_name}_{next_serial:03d}.mcaddon"
+            try:
+                zip_out = ZipFile(output_mcaddon, 'x', ZIP_STORED)
+                break
+            except FileExistsError:
+                next_serial += 1
+
+        try:
+            with zip_out:
+                # Write the new recipes, replacing any with the same name in the base
+                for name, recipe_json in recipes:
+                    arcname = f"{recipes_prefix}{name}.json"
+                    if arcname in zip_out.NameToInfo:
+                        raise ValueError(f"Duplicate recipe name: {name}")
+                    if arcname in base_recipes:
+                        replaced.add(arcname)
+                    zip_out.writestr(arcname, encode(recipe_json))
+
+                # Copy the remaining files from the base mcaddon
+                for info in zip_in.infolist():
+                    if info.is_dir() or info.filename in replaced:
+                        continue
+                    out_info = ZipInfo(info.filename, info.date_time)
+                    out_info.external_attr = info.external_attr
+                    out_info.file_size = info.file_size
+                    with zip_in.open(info) as src, zip_out.open(out_info, 'w') as dst:
+                        shutil.copyfileobj(src, dst)
+        except BaseException:
+            output_mcaddon.unlink()
+            raise
 
     return output_mcaddon
 
 
 def main() -> None:
     """
-    Convert Minecraft recipe text file to JSON format.
+    Convert Minecraft recipe text files to JSON format.
 
     Output will be written to the same directory with .json extension.
-    If --mcaddon is provided, also creates a new .mcaddon file with the recipe added.
+    Template files produce one .json file per variant.
+    If --mcaddon is provided, also creates one new .mcaddon file with the
+    recipes from every input file added.
     """
     parser = argparse.ArgumentParser(
-        description='Convert Minecraft recipe text file to JSON format.'
+        description='Convert Minecraft recipe text files to JSON format.'
     )
     parser.add_argument(
-        'input_file',
+        'input_files',
         type=Path,
-        help='Path to the recipe text file'
+        nargs='+',
+        metavar='input_file',
+        help='Path to a recipe text file'
     )
     parser.add_argument(
         '--mcaddon',
         type=Path,
-        help='Base .mcaddon file to clone and add recipe to'
+        help='Base .mcaddon file to clone and add the recipes to'
+    )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write canonical compact JSON (sorted keys, no whitespace)'
+    )
+    parser.add_argument(
+        '--json-backend',
+        choices=['auto', 'json', 'orjson'],
+        default='auto',
+        help='Encoder for --compact output; auto uses orjson when installed (default: auto)'
     )
 
     args = parser.parse_args()
 
-    # Validate input file exists
-    if not args.input_file.exists():
-        print(f"Error: Input file '{args.input_file}' does not exist", file=sys.stderr)
-        sys.exit(1)
+    if args.json_backend != 'auto' and not args.compact:
+        parser.error("--json-backend requires --compact")
+
+    # Validate input files exist
+    for input_file in args.input_files:
+        if not input_file.exists():
+            print(f"Error: Input file '{input_file}' does not exist", file=sys.stderr)
+            sys.exit(1)
 
     # Validate mcaddon file exists if provided
     if args.mcaddon and not args.mcaddon.exists():
@@ -264,28 +534,51 @@ def main() -> None:
         sys.exit(1)
 
     try:
-        # Read input file
-        content = args.input_file.read_text()
-
-        # Parse recipe
-        recipe_parser = RecipeParser(content)
-        recipe_parser.parse()
-
-        # Generate JSON
-        recipe_json = recipe_parser.to_json()
+        # Parse every recipe or template up front; recipes are produced lazily
+        templates = []
+        for input_file in args.input_files:
+            template = RecipeTemplate(input_file.read_text())
+            try:
+                template.parse()
+            except ValueError as e:
+                if len(args.input_files) == 1:
+                    raise
+                raise ValueError(f"{input_file}: {e}")
+            templates.append((input_file, template))
+
+        # Check the base mcaddon before writing anything, so a bad base fails cleanly
+        if args.mcaddon:
+            base_zip, _ = open_base_mcaddon(args.mcaddon)
+            base_zip.close()
 
-        # Determine output file
-        output_file = args.input_file.with_suffix('.json')
+        # Write JSON output for each recipe as it is produced
+        encode = get_canonical_encoder(args.json_backend) if args.compact else pretty_json
 
-        # Write JSON output
-        with output_file.open('w') as f:
-            json.dump(recipe_json, f, indent=2)
+        def written_recipes() -> Iterator[tuple[str, dict]]:
+            for input_file, template in templates:
+                recipes = template.expand(input_file.stem)
+                yield from write_json_files(recipes, input_file.parent, encode)
 
-        print(f"Successfully created: {output_file}")
+        written = written_recipes()
 
-        # If mcaddon option provided, create new mcaddon file
-        if args.mcaddon:
-            output_mcaddon = create_mcaddon_with_recipe(args.input_file, recipe_json, args.mcaddon)
+        # If mcaddon option provided, stream the same recipes into a new mcaddon file
+        output_mcaddon = None
+        try:
+            if args.mcaddon:
+                output_mcaddon = create_mcaddon_with_recipes(args.input_files[0], written, args.mcaddon, encode)
+        finally:
+            # Write any JSON files not reached, even if the mcaddon could not be built
+            for _ in written:
+                pass
+
+        for input_file, template in templates:
+            if template.variables:
+                print(f"Successfully created {template.variant_count} recipes: "
+                      f"{input_file.parent / input_file.stem}-*.json")
+            else:
+                print(f"Successfully created: {input_file.with_suffix('.json')}")
+
+        if output_mcaddon:
             print(f"Successfully created: {output_mcaddon}")
 
     except ValueError as e:
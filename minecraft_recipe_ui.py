@@ -8,8 +8,13 @@ import curses
 import os
 import subprocess
 import sys
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
+
+# Upper bound on conversions run at the same time
+MAX_CONCURRENT_JOBS = max(1, min(8, os.cpu_count() or 1))
 
 
 class FocusedWidget:
@@ -27,6 +32,47 @@ class Screen:
     RESULT = 1
 
 
+def find_converter_script() -> Path:
+    """Locate the converter script, or its zipapp when running from one."""
+    here = Path(__file__).parent
+    if here.is_file():
+        # Running from inside minecraft_recipe_ui.pyz; use the sibling archive
+        return here.parent / "minecraft_recipe.pyz"
+    return here / "minecraft_recipe.py"
+
+
+class JobStatus:
+    """Enum-like class for conversion job states."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class Job:
+    """A single queued conversion of one .txt file."""
+
+    def __init__(self, txt_file: Path, cmd: List[str]):
+        self.txt_file = txt_file
+        self.cmd = cmd
+        self.status = JobStatus.QUEUED
+        self.started_at = 0.0
+        self.elapsed = 0.0
+        self.message = ""
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped, successfully or not."""
+        return self.status not in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+    def elapsed_so_far(self) -> float:
+        """Run time in seconds, counting up while the job is running."""
+        if self.status == JobStatus.RUNNING:
+            return time.monotonic() - self.started_at
+        return self.elapsed
+
+
 class App:
     """Main application state and logic."""
 
@@ -38,10 +84,15 @@ class App:
         self.directory_selected = 0
         self.txt_files: List[Path] = []
         self.txt_file_selected = 0
+        self.checked_txt_files: Set[Path] = set()
         self.mcaddon_files: List[Path] = []
         self.mcaddon_file_selected = 0
         self.use_mcaddon = False
         self.result_message = ""
+        self.jobs: List[Job] = []
+        self.job_scroll = 0
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.cancelled = False
 
         self.load_directory_contents()
 
@@ -69,6 +120,7 @@ class App:
 
         # Load .txt files
         self.txt_files = []
+        self.checked_txt_files = set()
         try:
             for entry in sorted(self.current_directory.iterdir()):
                 if entry.is_file() and entry.suffix == '.txt':
@@ -148,21 +200,48 @@ class App:
         elif self.focused_widget == FocusedWidget.MCADDON_FILE and self.mcaddon_files:
             self.mcaddon_file_selected = (self.mcaddon_file_selected - 1) % len(self.mcaddon_files)
 
-    def execute_python_script(self):
-        """Execute the minecraft_recipe.py script with selected options."""
-        # Get selected .txt file
+    def toggle_txt_file(self):
+        """Check or uncheck the highlighted .txt file and move to the next one."""
         if not self.txt_files or self.txt_file_selected >= len(self.txt_files):
+            return
+        txt_file = self.txt_files[self.txt_file_selected]
+        if txt_file in self.checked_txt_files:
+            self.checked_txt_files.remove(txt_file)
+        else:
+            self.checked_txt_files.add(txt_file)
+
+        # Stop at the last file rather than wrapping around
+        if self.txt_file_selected < len(self.txt_files) - 1:
+            self.txt_file_selected += 1
+
+    def toggle_all_txt_files(self):
+        """Check every .txt file, or uncheck them all if all are checked."""
+        if len(self.checked_txt_files) == len(self.txt_files):
+            self.checked_txt_files = set()
+        else:
+            self.checked_txt_files = set(self.txt_files)
+
+    def files_to_convert(self) -> List[Path]:
+        """Return the checked .txt files, or the highlighted one if none are checked."""
+        if self.checked_txt_files:
+            return [f for f in self.txt_files if f in self.checked_txt_files]
+        if self.txt_files and self.txt_file_selected < len(self.txt_files):
+            return [self.txt_files[self.txt_file_selected]]
+        return []
+
+    def execute_python_script(self):
+        """Queue the minecraft_recipe.py script for every selected .txt file."""
+        txt_files = self.files_to_convert()
+        if not txt_files:
             self.result_message = "Error: No .txt file selected"
             self.screen = Screen.RESULT
             return
 
-        txt_file = self.txt_files[self.txt_file_selected]
-
         # Build command - use python3 to run the script directly
-        script_path = Path(__file__).parent / "minecraft_recipe.py"
-        cmd = [sys.executable, str(script_path), str(txt_file)]
+        script_path = find_converter_script()
 
-        # Add mcaddon option if enabled
+        # Check the mcaddon option if enabled
+        mcaddon_file = None
         if self.use_mcaddon:
             if not self.mcaddon_files or self.mcaddon_file_selected >= len(self.mcaddon_files):
                 self.result_message = "Error: No .mcaddon file selected"
@@ -170,22 +249,91 @@ class App:
                 return
 
             mcaddon_file = self.mcaddon_files[self.mcaddon_file_selected]
-            cmd.extend(["--mcaddon", str(mcaddon_file)])
+
+        # One JSON conversion per file; the .mcaddon is built once for all of them
+        file_jobs = [
+            Job(txt_file, [sys.executable, str(script_path), str(txt_file)])
+            for txt_file in txt_files
+        ]
+        self.jobs = list(file_jobs)
+        if mcaddon_file:
+            mcaddon_job = Job(mcaddon_file, [sys.executable, str(script_path)])
+            self.jobs.append(mcaddon_job)
+
+        self.job_scroll = 0
+        self.executor = ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_JOBS, len(self.jobs)))
+        futures = [self.executor.submit(self.run_job, job) for job in file_jobs]
+        if mcaddon_file:
+            # Submitted last, so it only starts once every file job has been picked up
+            self.executor.submit(self.run_mcaddon_job, mcaddon_job, file_jobs, futures)
+
+        self.screen = Screen.RESULT
+
+    def run_job(self, job: Job):
+        """Run one conversion job; called on a worker thread."""
+        if self.cancelled:
+            job.status = JobStatus.CANCELLED
+            return
+
+        job.started_at = time.monotonic()
+        job.status = JobStatus.RUNNING
 
         # Execute command
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            result = subprocess.run(job.cmd, capture_output=True, text=True, check=False)
 
             if result.returncode == 0:
-                self.result_message = f"Success!\n\n{result.stdout}"
+                job.message = result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+                job.status = JobStatus.DONE
             else:
-                self.result_message = f"Error:\n\n{result.stderr}"
+                job.message = result.stderr.strip()
+                job.status = JobStatus.FAILED
         except FileNotFoundError:
-            self.result_message = f"Error: Python executable '{sys.executable}' not found."
+            job.message = f"Error: Python executable '{sys.executable}' not found."
+            job.status = JobStatus.FAILED
         except Exception as e:
-            self.result_message = f"Failed to execute command: {e}"
+            job.message = f"Failed to execute command: {e}"
+            job.status = JobStatus.FAILED
 
-        self.screen = Screen.RESULT
+        job.elapsed = time.monotonic() - job.started_at
+
+    def run_mcaddon_job(self, job: Job, file_jobs: List[Job], futures: List[Future]):
+        """Build one .mcaddon from every file that converted successfully."""
+        wait(futures)
+
+        converted = [str(file_job.txt_file) for file_job in file_jobs
+                     if file_job.status == JobStatus.DONE]
+        if not converted and not self.cancelled:
+            job.message = "Error: No recipes converted"
+            job.status = JobStatus.FAILED
+            return
+
+        job.cmd = job.cmd + converted + ["--mcaddon", str(job.txt_file)]
+        self.run_job(job)
+
+    def jobs_running(self) -> bool:
+        """Whether any queued job has not finished yet."""
+        return any(not job.finished for job in self.jobs)
+
+    def running_job_count(self) -> int:
+        """Number of jobs currently being converted."""
+        return sum(1 for job in self.jobs if job.status == JobStatus.RUNNING)
+
+    def scroll_jobs(self, delta: int):
+        """Scroll the job table on the result screen."""
+        self.job_scroll = max(0, min(self.job_scroll + delta, len(self.jobs) - 1))
+
+    def shutdown(self):
+        """Cancel queued jobs and wait for running ones to finish."""
+        self.cancelled = True
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+        # Jobs whose futures were cancelled never reached run_job
+        for job in self.jobs:
+            if job.status == JobStatus.QUEUED:
+                job.status = JobStatus.CANCELLED
 
 
 class UI:
@@ -222,8 +370,9 @@ class UI:
             if len(title_str) < width - 2:
                 self.stdscr.addstr(y, x + 2, title_str, color | curses.A_BOLD)
 
-    def draw_list(self, y, x, height, width, title, items, selected_idx, focused=False):
-        """Draw a list widget."""
+    def draw_list(self, y, x, height, width, title, items, selected_idx, focused=False,
+                  checked=None):
+        """Draw a list widget, with checkboxes if a set of checked items is given."""
         self.draw_box(y, x, height, width, title, focused)
 
         # Calculate visible window
@@ -238,11 +387,13 @@ class UI:
 
             # Truncate item name if too long
             item_name = str(item.name) if hasattr(item, 'name') else str(item)
-            max_width = width - 4
+            max_width = width - 4 - (4 if checked is not None else 0)
             if len(item_name) > max_width:
                 item_name = item_name[:max_width - 3] + "..."
 
             prefix = "> " if is_selected else "  "
+            if checked is not None:
+                prefix += "[x] " if item in checked else "[ ] "
 
             if is_selected:
                 self.stdscr.addstr(item_y, x + 1, prefix + item_name, curses.color_pair(4) | curses.A_BOLD)
@@ -283,9 +434,11 @@ class UI:
 
         # Txt file selector
         list_height = min(8, len(app.txt_files) + 2)
+        txt_title = f"Select .txt files ({len(app.checked_txt_files)} checked)"
         self.draw_list(current_y, 2, list_height, width - 4,
-                      "Select .txt file", app.txt_files, app.txt_file_selected,
-                      app.focused_widget == FocusedWidget.TXT_FILE)
+                      txt_title, app.txt_files, app.txt_file_selected,
+                      app.focused_widget == FocusedWidget.TXT_FILE,
+                      checked=app.checked_txt_files)
         current_y += list_height + 1
 
         # Mcaddon toggle
@@ -320,7 +473,7 @@ class UI:
         current_y += 4
 
         # Instructions
-        instructions = "Tab: Next | Shift+Tab: Prev | Enter: Select | Up/Down: Navigate | q/Esc: Quit"
+        instructions = "Tab: Next | Shift+Tab: Prev | Enter: Select | Space: Check | a: All/None | Up/Down: Navigate | q/Esc: Quit"
         if current_y < height - 1:
             self.stdscr.addstr(height - 2, 2, instructions[:width-4], curses.color_pair(3))
 
@@ -328,6 +481,10 @@ class UI:
 
     def draw_result_screen(self, app: App):
         """Draw the result screen."""
+        if app.jobs:
+            self.draw_jobs_screen(app)
+            return
+
         self.stdscr.clear()
         height, width = self.stdscr.getmaxyx()
 
@@ -356,6 +513,58 @@ class UI:
 
         self.stdscr.refresh()
 
+    def draw_jobs_screen(self, app: App):
+        """Draw the live table of queued conversion jobs."""
+        # erase() rather than clear() avoids flicker on periodic redraws
+        self.stdscr.erase()
+        height, width = self.stdscr.getmaxyx()
+
+        done = sum(1 for job in app.jobs if job.finished)
+        failed = sum(1 for job in app.jobs if job.status == JobStatus.FAILED)
+        title = f"Jobs: {done}/{len(app.jobs)} finished, {failed} failed"
+
+        result_height = height - 4
+        self.draw_box(1, 2, result_height, width - 4, title, False)
+
+        # Table header
+        name_width = max(10, min(30, (width - 6) // 3))
+        header = f"{'File':<{name_width}} {'Status':<9} {'Time':>7}  Message"
+        self.stdscr.addstr(2, 4, header[:width-6], curses.color_pair(1) | curses.A_BOLD)
+
+        # Table rows
+        visible_rows = result_height - 3
+        for i, job in enumerate(app.jobs[app.job_scroll:app.job_scroll + visible_rows]):
+            name = job.txt_file.name
+            if len(name) > name_width:
+                name = name[:name_width - 3] + "..."
+            elapsed = f"{job.elapsed_so_far():.2f}s" if job.status != JobStatus.QUEUED else ""
+            message = job.message.replace('\n', ' ')
+            row = f"{name:<{name_width}} {job.status:<9} {elapsed:>7}  {message}"
+
+            if job.status == JobStatus.DONE:
+                color = curses.color_pair(5)
+            elif job.status == JobStatus.FAILED:
+                color = curses.color_pair(2) | curses.A_BOLD
+            else:
+                color = curses.color_pair(3)
+            self.stdscr.addstr(3 + i, 4, row[:width-6], color)
+
+        # Instructions
+        instructions = "Up/Down: Scroll | Enter, q, or Esc: Quit (cancels queued jobs)"
+        self.stdscr.addstr(height - 2, 2, instructions[:width-4], curses.color_pair(3))
+
+        self.stdscr.refresh()
+
+    def draw_waiting_message(self, app: App):
+        """Show that the app is waiting for running jobs before it exits."""
+        height, width = self.stdscr.getmaxyx()
+        running = app.running_job_count()
+        message = f"Waiting for {running} running job{'s' if running != 1 else ''} to finish..."
+        self.stdscr.move(height - 2, 0)
+        self.stdscr.clrtoeol()
+        self.stdscr.addstr(height - 2, 2, message[:width-4], curses.color_pair(2) | curses.A_BOLD)
+        self.stdscr.refresh()
+
     def draw(self, app: App):
         """Draw the appropriate screen based on app state."""
         if app.screen == Screen.MAIN:
@@ -376,6 +585,12 @@ def handle_main_screen_input(app: App, key: int) -> bool:
         app.previous_item()
     elif key == curses.KEY_DOWN:
         app.next_item()
+    elif key == ord(' '):
+        if app.focused_widget == FocusedWidget.TXT_FILE:
+            app.toggle_txt_file()
+    elif key in (ord('a'), ord('A')):
+        if app.focused_widget == FocusedWidget.TXT_FILE:
+            app.toggle_all_txt_files()
     elif key in (10, 13, curses.KEY_ENTER):  # Enter
         if app.focused_widget == FocusedWidget.DIRECTORY:
             if app.directories and app.directory_selected < len(app.directories):
@@ -392,6 +607,14 @@ def handle_result_screen_input(app: App, key: int) -> bool:
     """Handle keyboard input for result screen. Returns True to quit."""
     if key in (ord('q'), ord('Q'), 27, 10, 13, curses.KEY_ENTER):  # q, Esc, or Enter
         return True
+    elif key == curses.KEY_UP:
+        app.scroll_jobs(-1)
+    elif key == curses.KEY_DOWN:
+        app.scroll_jobs(1)
+    elif key == curses.KEY_PPAGE:
+        app.scroll_jobs(-10)
+    elif key == curses.KEY_NPAGE:
+        app.scroll_jobs(10)
     return False
 
 
@@ -403,6 +626,9 @@ def run_app(stdscr):
     while True:
         ui.draw(app)
 
+        # Poll for input while jobs are running so the table stays live
+        stdscr.timeout(200 if app.jobs_running() else -1)
+
         try:
             key = stdscr.getch()
         except KeyboardInterrupt:
@@ -415,6 +641,10 @@ def run_app(stdscr):
             if handle_result_screen_input(app, key):
                 break
 
+    if app.running_job_count():
+        ui.draw_waiting_message(app)
+    app.shutdown()
+
 
 def main():
     """Entry point."""
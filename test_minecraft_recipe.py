@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Tests for the Minecraft Bedrock Recipe Generator.
+Run with: python3 -m unittest test_minecraft_recipe
+"""
+
+import py_compile
+import subprocess
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import minecraft_recipe
+
+SCRIPT_DIR = Path(__file__).parent
+BASE_MCADDON = SCRIPT_DIR / 'Circuits & Machines (7).mcaddon'
+
+TEMPLATE = """@color = white, orange, magenta
+myname:{color}_lamp
+A-A
+ABA
+ACA
+A = minecraft:{color}_wool
+B = minecraft:stone
+C = minecraft:coal
+1
+"""
+
+# Modules the converter needs anyway; their import time is the yardstick
+REFERENCE_MODULES = ('argparse', 'json', 'pathlib')
+
+# Budget for minecraft_recipe's own import time (with the reference modules
+# already loaded), as a fraction of the reference modules' import time
+IMPORT_TIME_BUDGET_RATIO = 0.15
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter in the script directory."""
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=SCRIPT_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+
+class ImportTimeTest(unittest.TestCase):
+    """Keep plain .txt to .json conversion fast to start."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Time loading bytecode, not compiling source, as an installed copy would
+        py_compile.compile(str(SCRIPT_DIR / 'minecraft_recipe.py'), doraise=True)
+
+    def test_import_time_within_budget(self):
+        """Importing the module adds little on top of the stdlib modules it needs."""
+        ratios = []
+        for _ in range(5):
+            result = run_python(
+                '-X', 'importtime', '-c',
+                f"import {', '.join(REFERENCE_MODULES)}; import minecraft_recipe"
+            )
+
+            # Cumulative microseconds of each top-level import
+            timings = {}
+            for line in result.stderr.splitlines():
+                fields = line.split('|')
+                if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2].startswith('  '):
+                    timings[fields[2].strip()] = int(fields[1])
+
+            self.assertIn('minecraft_recipe', timings, "minecraft_recipe missing from -X importtime output")
+            reference = sum(timings[name] for name in REFERENCE_MODULES if name in timings)
+            ratios.append(timings['minecraft_recipe'] / reference)
+
+        self.assertLess(min(ratios), IMPORT_TIME_BUDGET_RATIO)
+
+    def test_mcaddon_modules_not_imported(self):
+        """Modules only needed for .mcaddon output are loaded lazily."""
+        result = run_python(
+            '-c',
+            'import sys, minecraft_recipe; '
+            'print(" ".join(m for m in ("zipfile", "tempfile", "shutil", "typing") if m in sys.modules))'
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+
+class McaddonFailureTest(unittest.TestCase):
+    """A failed .mcaddon build must not lose the JSON output."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.dir = Path(self.temp_dir.name)
+        (self.dir / 'lamp.txt').write_text(TEMPLATE)
+
+    def run_main(self, *args: str) -> int:
+        """Run main() with the given arguments and return its exit code."""
+        with mock.patch.object(sys, 'argv', ['minecraft_recipe.py', *args]), \
+                mock.patch('sys.stdout'), mock.patch('sys.stderr'):
+            try:
+                minecraft_recipe.main()
+            except SystemExit as e:
+                return e.code
+        return 0
+
+    def test_invalid_base_fails_before_writing(self):
+        """A base that is not a zip is rejected before any file is written."""
+        bad = self.dir / 'bad.mcaddon'
+        bad.write_text('not a zip')
+
+        self.assertEqual(self.run_main(str(self.dir / 'lamp.txt'), '--mcaddon', str(bad)), 1)
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()), ['bad.mcaddon', 'lamp.txt'])
+
+    def test_base_without_behavior_pack_fails_before_writing(self):
+        """A base without a behavior pack is rejected before any file is written."""
+        nobp = self.dir / 'nobp.mcaddon'
+        with zipfile.ZipFile(nobp, 'w') as zip_out:
+            zip_out.writestr('pack/manifest.json', '{}')
+
+        self.assertEqual(self.run_main(str(self.dir / 'lamp.txt'), '--mcaddon', str(nobp)), 1)
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()), ['lamp.txt', 'nobp.mcaddon'])
+
+    def test_write_error_keeps_json_output(self):
+        """An I/O error while building the .mcaddon still writes every JSON file."""
+        with mock.patch.object(zipfile.ZipFile, 'writestr', side_effect=OSError('disk full')):
+            code = self.run_main(str(self.dir / 'lamp.txt'), '--mcaddon', str(BASE_MCADDON))
+
+        self.assertEqual(code, 2)
+        self.assertEqual(
+            sorted(p.name for p in self.dir.iterdir()),
+            ['lamp-magenta.json', 'lamp-orange.json', 'lamp-white.json', 'lamp.txt']
+        )
+
+
+class RecipeTemplateTest(unittest.TestCase):
+    """Template parsing and expansion."""
+
+    def test_variant_names_are_unique(self):
+        """Values containing underscores cannot make two variants share a name."""
+        template = minecraft_recipe.RecipeTemplate(
+            "@a = x, x_y\n@b = y_z, z\nmyname:{a}.{b}\nAAA\nAAA\nAAA\nA = minecraft:stone\n1"
+        )
+        template.parse()
+        names = [name for name, _ in template.expand('dup')]
+        self.assertEqual(len(names), 4)
+        self.assertEqual(len(set(names)), 4)
+
+    def test_variable_missing_from_identifier_rejected(self):
+        """Every variable must appear in the result identifier, so variants get distinct IDs."""
+        template = minecraft_recipe.RecipeTemplate(
+            "@color = white, red\n@wood = oak, spruce\nmyname:{color}_lamp\nAAA\nABA\nAAA\n"
+            "A = minecraft:{color}_wool\nB = minecraft:{wood}_planks\n1"
+        )
+        with self.assertRaisesRegex(ValueError, "^Line 3: .*missing from the result identifier: wood"):
+            template.parse()
+
+    def test_duplicate_value_rejected(self):
+        """A value listed twice for one variable is an error."""
+        template = minecraft_recipe.RecipeTemplate(
+            "@a = x, x\nmyname:{a}\nAAA\nAAA\nAAA\nA = minecraft:stone\n1"
+        )
+        with self.assertRaisesRegex(ValueError, "Duplicate value"):
+            template.parse()
+
+    def test_error_line_numbers_count_variable_lines(self):
+        """Errors in the recipe body report line numbers within the whole file."""
+        template = minecraft_recipe.RecipeTemplate(
+            "@a = x, y\nmyname:{a}\nAAA\nAAA\nAAA\nA = minecraft:stone\nB minecraft:{a}\n1"
+        )
+        with self.assertRaisesRegex(ValueError, "^Line 7: Invalid substitution format"):
+            template.parse()
+
+    def test_structure_checked_before_expansion(self):
+        """A malformed body fails in parse(), before any variant is emitted."""
+        template = minecraft_recipe.RecipeTemplate(
+            "@a = x, y\nmyname:{a}\nAA\nAAA\nAAA\nA = minecraft:{a}\n1"
+        )
+        with self.assertRaisesRegex(ValueError, "^Line 3 pattern"):
+            template.parse()
+
+    def test_duplicate_mcaddon_entry_rejected(self):
+        """Two recipes with the same name are not both written to an .mcaddon."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / 'lamp.txt'
+            recipes = [('lamp', {}), ('lamp', {})]
+            with self.assertRaisesRegex(ValueError, "Duplicate recipe name"):
+                minecraft_recipe.create_mcaddon_with_recipes(input_file, recipes, BASE_MCADDON)
+            self.assertEqual(list(Path(temp_dir).iterdir()), [])
+
+
+class CanonicalJsonTest(unittest.TestCase):
+    """Canonical output must not depend on the JSON backend."""
+
+    RECIPES = [
+        {'b': 1, 'a': {'z': None, 'y': True, 'x': -5}},
+        {'text': 'caf\u00e9 \u00fcber \u2603 \U0001f600 \u2028 \u2029'},
+        {'control': ''.join(chr(c) for c in range(32)) + '\x7f "quoted" back\\slash /'},
+        {'nested': [[], {}, [1, [2, {'k': 'v'}]]], 'empty': ''},
+        {'result': {'count': 99999999999999999999999, 'min': -2 ** 70}},
+    ]
+
+    def test_backends_produce_identical_bytes(self):
+        """orjson and the standard library emit byte-identical output."""
+        try:
+            orjson_encode = minecraft_recipe.get_canonical_encoder('orjson')
+        except ValueError:
+            self.skipTest("orjson is not installed")
+        json_encode = minecraft_recipe.get_canonical_encoder('json')
+
+        for recipe_json in self.RECIPES:
+            with self.subTest(recipe_json=recipe_json):
+                self.assertEqual(orjson_encode(recipe_json), json_encode(recipe_json))
+
+    def test_output_is_sorted_and_compact(self):
+        """Keys are sorted and no whitespace is added."""
+        encode = minecraft_recipe.get_canonical_encoder('json')
+        self.assertEqual(encode({'b': [1, 2], 'a': 'x'}), b'{"a":"x","b":[1,2]}')
+
+    def test_backend_requires_compact(self):
+        """--json-backend without --compact is a usage error."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_file = Path(temp_dir) / 'sample.txt'
+            input_file.write_text((SCRIPT_DIR / 'sample.txt').read_text())
+            argv = ['minecraft_recipe.py', str(input_file), '--json-backend', 'json']
+            with mock.patch.object(sys, 'argv', argv), mock.patch('sys.stderr'):
+                with self.assertRaises(SystemExit) as cm:
+                    minecraft_recipe.main()
+            self.assertEqual(cm.exception.code, 2)
+            self.assertFalse(input_file.with_suffix('.json').exists())
+
+    def test_unknown_backend_rejected(self):
+        """An unknown backend name is an error."""
+        with self.assertRaises(ValueError):
+            minecraft_recipe.get_canonical_encoder('ujson')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the Minecraft Recipe Converter terminal UI.
+Exercises the App job queue directly, without curses.
+Run with: python3 -m unittest test_minecraft_recipe_ui
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import minecraft_recipe_ui
+from minecraft_recipe_ui import App, JobStatus
+
+SCRIPT_DIR = Path(__file__).parent
+BASE_MCADDON = SCRIPT_DIR / 'Circuits & Machines (7).mcaddon'
+
+
+def wait_for_jobs(app: App, timeout: float = 60.0):
+    """Wait until every queued job has finished."""
+    deadline = time.monotonic() + timeout
+    while app.jobs_running():
+        if time.monotonic() > deadline:
+            raise AssertionError("jobs did not finish in time")
+        time.sleep(0.05)
+
+
+class AppTestCase(unittest.TestCase):
+    """Run an App in a temporary directory of recipe files."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = Path(temp_dir.name)
+
+        cwd = Path.cwd()
+        os.chdir(self.dir)
+        self.addCleanup(os.chdir, cwd)
+
+    def make_app(self, good: int = 3, bad: int = 0) -> App:
+        """Create recipe files and an App showing them."""
+        for i in range(good):
+            shutil.copy(SCRIPT_DIR / 'sample.txt', self.dir / f"good{i:03d}.txt")
+        for i in range(bad):
+            shutil.copy(SCRIPT_DIR / 'bad.txt', self.dir / f"bad{i:03d}.txt")
+
+        app = App()
+        self.addCleanup(app.shutdown)
+        return app
+
+
+class SelectionTest(AppTestCase):
+    """Checking files in the .txt list."""
+
+    def test_check_all_then_none(self):
+        """'a' checks every file, and again unchecks them all."""
+        app = self.make_app(good=5)
+
+        app.toggle_all_txt_files()
+        self.assertEqual(app.files_to_convert(), app.txt_files)
+
+        app.toggle_all_txt_files()
+        self.assertEqual(app.checked_txt_files, set())
+
+    def test_falls_back_to_highlighted_file(self):
+        """With nothing checked, the highlighted file is converted."""
+        app = self.make_app(good=3)
+        app.txt_file_selected = 2
+
+        self.assertEqual(app.files_to_convert(), [app.txt_files[2]])
+
+    def test_space_checks_and_advances(self):
+        """Toggling a file moves the cursor, stopping at the last file."""
+        app = self.make_app(good=2)
+
+        app.toggle_txt_file()
+        app.toggle_txt_file()
+        app.toggle_txt_file()
+
+        self.assertEqual(app.txt_file_selected, 1)
+        self.assertEqual(app.files_to_convert(), [app.txt_files[0]])
+
+
+class JobQueueTest(AppTestCase):
+    """Running queued conversions on the worker pool."""
+
+    def test_runs_every_checked_file(self):
+        """Each checked file gets a job; failures record the script's stderr."""
+        app = self.make_app(good=3, bad=1)
+        app.toggle_all_txt_files()
+
+        app.execute_python_script()
+        wait_for_jobs(app)
+
+        statuses = {job.txt_file.name: job.status for job in app.jobs}
+        self.assertEqual(statuses, {
+            'bad000.txt': JobStatus.FAILED,
+            'good000.txt': JobStatus.DONE,
+            'good001.txt': JobStatus.DONE,
+            'good002.txt': JobStatus.DONE,
+        })
+
+        failed = next(job for job in app.jobs if job.status == JobStatus.FAILED)
+        self.assertIn("Pattern symbols without substitutions", failed.message)
+        self.assertTrue(all(job.elapsed > 0 for job in app.jobs))
+        self.assertEqual(len(list(self.dir.glob('*.json'))), 3)
+
+    def test_shutdown_cancels_queued_jobs(self):
+        """Jobs that have not started are cancelled; started ones finish."""
+        app = self.make_app(good=24)
+        app.toggle_all_txt_files()
+
+        with mock.patch.object(minecraft_recipe_ui, 'MAX_CONCURRENT_JOBS', 2):
+            app.execute_python_script()
+        app.shutdown()
+
+        statuses = [job.status for job in app.jobs]
+        self.assertNotIn(JobStatus.QUEUED, statuses)
+        self.assertNotIn(JobStatus.RUNNING, statuses)
+        self.assertIn(JobStatus.CANCELLED, statuses)
+        self.assertEqual(
+            statuses.count(JobStatus.DONE),
+            len(list(self.dir.glob('*.json')))
+        )
+
+    def test_mcaddon_built_once_for_all_files(self):
+        """With the McAddon option, one archive holds every converted recipe."""
+        app = self.make_app(good=3, bad=1)
+        shutil.copy(BASE_MCADDON, self.dir / 'base.mcaddon')
+        app.load_directory_contents()
+        app.toggle_all_txt_files()
+        app.use_mcaddon = True
+
+        app.execute_python_script()
+        wait_for_jobs(app)
+
+        self.assertEqual(len(app.jobs), 5)
+        self.assertEqual(app.jobs[-1].status, JobStatus.DONE)
+        self.assertEqual(sorted(p.name for p in self.dir.glob('*.mcaddon')), ['base.mcaddon', 'base_001.mcaddon'])
+
+        with zipfile.ZipFile(self.dir / 'base_001.mcaddon') as zip_in:
+            recipes = sorted(Path(name).name for name in zip_in.namelist() if '/recipes/good' in name)
+        self.assertEqual(recipes, ['good000.json', 'good001.json', 'good002.json'])
+
+
+if __name__ == '__main__':
+    unittest.main()